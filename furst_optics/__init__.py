@@ -2,14 +2,6 @@
 An idealized raytrace model of the FURST optical system.
 """
 
-from . import typevars
-from . import abc
-from . import sources
-from . import apertures
-from . import feed_optics
-from . import gratings
-from . import detectors
-
 __all__ = [
     "typevars",
     "abc",
@@ -19,3 +11,19 @@ __all__ = [
     "gratings",
     "detectors",
 ]
+
+
+def __getattr__(name: str):
+    # Import the submodules on first access (PEP 562) so that using one
+    # component does not require loading the rest of the package.
+    if name in __all__:
+        import importlib
+
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,18 @@
 import abc
 import dataclasses
+import numpy as np
 import astropy.units as u
 import named_arrays as na
 import optika
+import furst_optics
 
 __all__ = [
     "AbstractComponent",
     "AbstractRowlandComponent",
 ]
 
+_ZERO_MM = 0 * u.mm
+
 
 @dataclasses.dataclass(eq=False, repr=False)
 class AbstractComponent(
@@ -20,13 +24,74 @@ class AbstractComponent(
     of the optical system.
     """
 
+    # Components are not arrays, so opt out of numpy's ufunc machinery
+    # instead of letting it try to coerce them into object arrays.
+    __array_ufunc__ = None
+
     @property
     @abc.abstractmethod
     def surface(self):
         """
         Convert this object into an instance of
         :class:`optika.surfaces.AbstractSurface`.
+
+        Subclasses compute this surface once and cache the result,
+        so if the fields of this object are modified,
+        the cached surface needs to be cleared using ``del self.surface``
+        (and ``del self.transformation`` for the Rowland components,
+        which cache their transformation too).
+        """
+
+    @classmethod
+    def from_arrays(
+        cls: type[furst_optics.typevars.ComponentT],
+        axis: str,
+        **kwargs,
+    ) -> furst_optics.typevars.ComponentT:
+        """
+        Construct a single instance of this component which represents
+        many components along a common logical axis.
+
+        Since the fields of the result are arrays, its :attr:`surface`
+        can be raytraced all at once instead of looping over
+        separate components.
+
+        Parameters
+        ----------
+        axis
+            The name of the logical axis shared by all the array-valued
+            arguments.
+            Any one-dimensional :class:`numpy.ndarray`,
+            :class:`astropy.units.Quantity`, or :class:`list` arguments
+            are converted to instances of :class:`named_arrays.ScalarArray`
+            along this axis.
+        kwargs
+            The fields of this component.
         """
+        fields = dict()
+        for key, value in kwargs.items():
+            if isinstance(value, (list, tuple)):
+                if any(isinstance(v, u.Quantity) for v in value):
+                    value = u.Quantity(value)
+                else:
+                    value = np.array(value)
+            if isinstance(value, np.ndarray) and value.ndim != 0:
+                if value.ndim != 1:
+                    raise ValueError(
+                        f"argument {key!r} must be one-dimensional "
+                        f"if it is a numpy array or Quantity, "
+                        f"got {value.ndim} dimensions"
+                    )
+                value = na.ScalarArray(value, axes=axis)
+            if isinstance(value, na.AbstractArray):
+                shape = value.shape
+                if shape and axis not in shape:
+                    raise ValueError(
+                        f"array-valued argument {key!r} with shape {shape} "
+                        f"does not have the axis {axis!r}"
+                    )
+            fields[key] = value
+        return cls(**fields)
 
 
 @dataclasses.dataclass(eq=False, repr=False)
@@ -54,14 +119,26 @@ class AbstractRowlandComponent(
         """
 
     @property
-    def transformation(self) -> None | na.transformations.AbstractTransformation:
-        return super().transformation @ na.transformations.TransformationList(
-            [
-                na.transformations.Cartesian3dTranslation(
-                    x=0 * u.mm,
-                    y=0 * u.mm,
-                    z=self.rowland_radius,
-                ),
-                na.transformations.Cartesian3dRotationY(self.rowland_azimuth),
-            ]
+    def _transformation_rowland(self) -> na.transformations.AbstractTransformation:
+        """
+        The transformation from the center of the Rowland circle to the
+        nominal position of this component.
+
+        This is built using the full arrays of :attr:`rowland_radius`
+        and :attr:`rowland_azimuth`, so array-valued parameters are broadcast
+        by :mod:`named_arrays` instead of iterating over each component.
+        The rotation and translation are composed directly into a single
+        :class:`named_arrays.transformations.AffineTransformation`
+        so that it can be applied as one matrix multiplication and addition.
+        """
+        rotation = na.transformations.Cartesian3dRotationY(self.rowland_azimuth)
+        translation = na.transformations.Cartesian3dTranslation(
+            x=_ZERO_MM,
+            y=_ZERO_MM,
+            z=self.rowland_radius,
         )
+        return rotation @ translation
+
+    @property
+    def transformation(self) -> None | na.transformations.AbstractTransformation:
+        return super().transformation @ self._transformation_rowland
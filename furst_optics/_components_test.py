@@ -1,4 +1,8 @@
+import copy
+import dataclasses
+import numpy as np
 import astropy.units as u
+import named_arrays as na
 import optika
 from optika._tests import test_mixins
 import furst_optics
@@ -12,6 +16,9 @@ class AbstractTestAbstactComponent(
         result = a.surface
         assert isinstance(result, optika.surfaces.AbstractSurface)
 
+    def test_surface_cached(self, a: furst_optics.abc.AbstractComponent):
+        assert a.surface is a.surface
+
 
 class AbstractTestAbstractRowlandComponent(
     AbstractTestAbstactComponent,
@@ -21,3 +28,26 @@ class AbstractTestAbstractRowlandComponent(
 
     def test_rowland_azimuth(self, a: furst_optics.abc.AbstractRowlandComponent):
         assert a.rowland_azimuth.unit.is_equivalent(u.deg)
+
+    def test_transformation_broadcast(
+        self,
+        a: furst_optics.abc.AbstractRowlandComponent,
+    ):
+        shape = na.shape_broadcasted(a.rowland_radius, a.rowland_azimuth)
+        result = a.transformation.shape
+        for axis in shape:
+            assert result[axis] == shape[axis]
+
+    def test_clear_cache(self, a: furst_optics.abc.AbstractRowlandComponent):
+        a = copy.copy(a)
+        assert isinstance(a.transformation, na.transformations.AbstractTransformation)
+        assert isinstance(a.surface, optika.surfaces.AbstractSurface)
+        assert {"surface", "transformation"} <= vars(a).keys()
+        a.rowland_radius = 2 * a.rowland_radius + 1 * u.mm
+        a.rowland_azimuth = a.rowland_azimuth + 20 * u.deg
+        del a.surface
+        del a.transformation
+        b = dataclasses.replace(a)
+        p = na.Cartesian3dVectorArray(1, 2, 3) * u.mm
+        assert np.all(a.transformation(p) == b.transformation(p))
+        assert np.all(a.surface.transformation(p) == b.surface.transformation(p))
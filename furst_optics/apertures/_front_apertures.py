@@ -1,3 +1,4 @@
+import functools
 import dataclasses
 import astropy.units as u
 import named_arrays as na
@@ -8,6 +9,8 @@ __all__ = [
     "FrontAperture",
 ]
 
+_ZERO_MM = 0 * u.mm
+
 
 @dataclasses.dataclass(eq=False, repr=False)
 class FrontAperture(
@@ -22,13 +25,13 @@ class FrontAperture(
     rocket skins.
     """
 
-    translation: u.Quantity | na.AbstractCartesian3dVectorArray = 0 * u.mm
+    translation: u.Quantity | na.AbstractCartesian3dVectorArray = _ZERO_MM
     """
     The physical location of the front aperture plate relative to the rest
     of the optical system.
     """
 
-    @property
+    @functools.cached_property
     def surface(self) -> optika.surfaces.Surface:
         return optika.surfaces.Surface(
             name="front aperture",
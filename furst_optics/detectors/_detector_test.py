@@ -1,6 +1,7 @@
 import pytest
 import astropy.units as u
 import named_arrays as na
+import optika
 from optika._tests import test_mixins
 import furst_optics._components_test
 
@@ -26,3 +27,18 @@ class TestDetector(
     furst_optics._components_test.AbstractTestAbstractRowlandComponent,
 ):
     pass
+
+
+def test_surfaces_from_sweep():
+    result = furst_optics.detectors.Detector.surfaces_from_sweep(
+        axis_pixel=na.Cartesian2dVectorArray(
+            x="detector_x",
+            y="detector_y",
+        ),
+        num_pixel=2048,
+        width_pixel=15 * u.um,
+        rowland_radius=1000 * u.mm,
+        rowland_azimuth=[5, 10, 15] * u.deg,
+    )
+    assert isinstance(result, optika.sensors.ImagingSensor)
+    assert result.transformation.shape == dict(detector=3)
@@ -1,3 +1,4 @@
+import functools
 import dataclasses
 import astropy.units as u
 import named_arrays as na
@@ -8,6 +9,12 @@ __all__ = [
     "Detector",
 ]
 
+_ZERO_MM = 0 * u.mm
+_ZERO_UM = 0 * u.um
+_ZERO_DEG = 0 * u.deg
+_ZERO_S = 0 * u.s
+_ZERO_KELVIN = 0 * u.K
+
 
 @dataclasses.dataclass(eq=False, repr=False)
 class Detector(
@@ -101,7 +108,7 @@ class Detector(
     The unique serial number associated with this detector.
     """
 
-    width_pixel: u.Quantity | na.AbstractCartesian2dVectorArray = 0 * u.mm
+    width_pixel: u.Quantity | na.AbstractCartesian2dVectorArray = _ZERO_MM
     """
     The physical width of a pixel for this detector.
     """
@@ -131,42 +138,42 @@ class Detector(
     A model of the light-sensitive material of this detector.
     """
 
-    rowland_radius: u.Quantity | na.AbstractScalar = 0 * u.mm
+    rowland_radius: u.Quantity | na.AbstractScalar = _ZERO_MM
     """
     The distance from the center of the Rowland circle to
     the center of the detector.
     """
 
-    rowland_azimuth: u.Quantity | na.AbstractScalar = 0 * u.deg
+    rowland_azimuth: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The azimuth of the center of the detector
     on the Rowland circle, relative to the optic axis
     of the instrument.
     """
 
-    translation: u.Quantity | na.AbstractCartesian3dVectorArray = 0 * u.mm
+    translation: u.Quantity | na.AbstractCartesian3dVectorArray = _ZERO_MM
     """
     Physical offset from the optic's nominal position on the
     Rowland circle.
     """
 
-    pitch: u.Quantity | na.AbstractScalar = 0 * u.deg
+    pitch: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the long axis of the detector.
     """
 
-    yaw: u.Quantity | na.AbstractScalar = 0 * u.deg
+    yaw: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the short axis of the detector.
     """
 
-    roll: u.Quantity | na.AbstractScalar = 0 * u.deg
+    roll: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the vector normal to
     the surface of the detector.
     """
 
-    temperature: u.Quantity | na.ScalarArray = 0 * u.K
+    temperature: u.Quantity | na.ScalarArray = _ZERO_KELVIN
     """
     The operating temperature of this detector.
     """
@@ -189,33 +196,33 @@ class Detector(
     temperature. 
     """
 
-    charge_diffusion: u.Quantity | na.AbstractScalar = 0 * u.um
+    charge_diffusion: u.Quantity | na.AbstractScalar = _ZERO_UM
     """
     The standard deviation of the charge diffusion kernel.
     """
 
-    timedelta_transfer: u.Quantity | na.AbstractScalar = 0 * u.s
+    timedelta_transfer: u.Quantity | na.AbstractScalar = _ZERO_S
     """
     The time required to transfer an image from the light-sensitive
     area of the detector to the masked area.
     """
 
-    timedelta_readout: u.Quantity | na.AbstractScalar = 0 * u.s
+    timedelta_readout: u.Quantity | na.AbstractScalar = _ZERO_S
     """
     The time required to digitize an image collected by the sensor.
     """
 
-    timedelta_exposure: u.Quantity | na.AbstractScalar = 0 * u.s
+    timedelta_exposure: u.Quantity | na.AbstractScalar = _ZERO_S
     """
     The current exposure time of this detector.
     """
 
-    timedelta_exposure_min: u.Quantity | na.AbstractScalar = 0 * u.s
+    timedelta_exposure_min: u.Quantity | na.AbstractScalar = _ZERO_S
     """
     The minimum exposure time allowed by this detector.
     """
 
-    timedelta_exposure_max: u.Quantity | na.AbstractScalar = 0 * u.s
+    timedelta_exposure_max: u.Quantity | na.AbstractScalar = _ZERO_S
     """
     The maximum exposure time allowed by this detector.
     """
@@ -226,7 +233,11 @@ class Detector(
     on this detector.
     """
 
-    @property
+    @functools.cached_property
+    def transformation(self) -> na.transformations.AbstractTransformation:
+        return super().transformation
+
+    @functools.cached_property
     def surface(self) -> optika.sensors.ImagingSensor:
         return optika.sensors.ImagingSensor(
             name=self.name,
@@ -237,3 +248,55 @@ class Detector(
             material=self.material,
             transformation=self.transformation,
         )
+
+    @classmethod
+    def surfaces_from_sweep(
+        cls,
+        axis_pixel: na.Cartesian2dVectorArray[str, str],
+        num_pixel: int | na.Cartesian2dVectorArray[int, int],
+        width_pixel: u.Quantity | na.AbstractCartesian2dVectorArray,
+        rowland_radius: u.Quantity | na.AbstractScalar,
+        rowland_azimuth: u.Quantity | na.AbstractScalar,
+        material: None | optika.sensors.AbstractImagingSensorMaterial = None,
+        axis: str = "detector",
+    ) -> optika.sensors.ImagingSensor:
+        """
+        Construct a single imaging sensor representing a sweep over
+        the pixel size and the position of the detector on the Rowland circle.
+
+        Instead of building a separate sensor for each point in the sweep,
+        the parameters are broadcast against each other so that the result
+        can be raytraced all at once.
+
+        Parameters
+        ----------
+        axis_pixel
+            The name of each axis of the pixel array.
+        num_pixel
+            The number of pixels along each axis of the pixel array.
+        width_pixel
+            The physical width of a pixel for each detector in the sweep.
+        rowland_radius
+            The distance from the center of the Rowland circle to
+            the center of each detector in the sweep.
+        rowland_azimuth
+            The azimuth of the center of each detector in the sweep
+            on the Rowland circle.
+        material
+            A model of the light-sensitive material of the detectors.
+        axis
+            The name of the logical axis used for any one-dimensional
+            :class:`astropy.units.Quantity` arguments.
+        """
+
+        detector = cls.from_arrays(
+            axis=axis,
+            width_pixel=width_pixel,
+            axis_pixel=axis_pixel,
+            num_pixel=num_pixel,
+            material=material,
+            rowland_radius=rowland_radius,
+            rowland_azimuth=rowland_azimuth,
+        )
+
+        return detector.surface
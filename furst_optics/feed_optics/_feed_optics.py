@@ -1,4 +1,6 @@
 from typing import Generic
+import math
+import functools
 import dataclasses
 import numpy as np
 import astropy.units as u
@@ -10,6 +12,9 @@ __all__ = [
     "FeedOptic",
 ]
 
+_ZERO_MM = 0 * u.mm
+_ZERO_DEG = 0 * u.deg
+
 
 @dataclasses.dataclass(eq=False, repr=False)
 class FeedOptic(
@@ -94,28 +99,28 @@ class FeedOptic(
     The human-readable name of this optic.
     """
 
-    radius: u.Quantity | na.AbstractScalar = 0 * u.deg
+    radius: u.Quantity | na.AbstractScalar = _ZERO_MM
     """
     The radius of curvature of the optical surface.
     """
 
-    aperture_subtent: u.Quantity | na.AbstractScalar = 0 * u.deg
+    aperture_subtent: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angular width of the clear aperture.
     """
 
-    aperture_height: u.Quantity | na.AbstractScalar = 0 * u.mm
+    aperture_height: u.Quantity | na.AbstractScalar = _ZERO_MM
     """
     The physical height of the clear aperture.
     """
 
-    margin_polishing: u.Quantity | na.AbstractScalar = 0 * u.mm
+    margin_polishing: u.Quantity | na.AbstractScalar = _ZERO_MM
     """
     The height above and below the clear aperture needed to 
     hold the optic for polishing.
     """
 
-    margin_mounting: u.Quantity | na.AbstractScalar = 0 * u.mm
+    margin_mounting: u.Quantity | na.AbstractScalar = _ZERO_MM
     """
     The length of the optic used to hold it in its mount.
     """
@@ -126,58 +131,66 @@ class FeedOptic(
     in the target spectral range.
     """
 
-    rowland_radius: u.Quantity | na.AbstractScalar = 0 * u.mm
+    rowland_radius: u.Quantity | na.AbstractScalar = _ZERO_MM
     """
     The distance from the center of the Rowland circle to
     the virtual image of the Sun within the feed optic.
     """
 
-    rowland_azimuth: u.Quantity | na.AbstractScalar = 0 * u.deg
+    rowland_azimuth: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The azimuth of the virtual image of the Sun
     on the Rowland circle, relative to the optic axis
     of the instrument.
     """
 
-    translation: u.Quantity | na.AbstractCartesian3dVectorArray = 0 * u.mm
+    translation: u.Quantity | na.AbstractCartesian3dVectorArray = _ZERO_MM
     """
     Physical offset from the optic's nominal position on the
     Rowland circle.
     """
 
-    pitch: u.Quantity | na.AbstractScalar = 0 * u.deg
+    pitch: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the vector tangent to the
     Rowland circle.
     """
 
-    yaw: u.Quantity | na.AbstractScalar = 0 * u.deg
+    yaw: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the axis of symmetry
     of the feed optic.
     """
 
-    roll: u.Quantity | na.AbstractScalar = 0 * u.deg
+    roll: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the vector normal to
     the Rowland circle.
     """
 
     @property
+    def _translation_image(self) -> na.transformations.Cartesian3dTranslation:
+        """
+        The translation between this optic and the virtual image of the Sun,
+        half the radius of curvature along the optic axis.
+        """
+        return na.transformations.Cartesian3dTranslation(
+            x=_ZERO_MM,
+            y=_ZERO_MM,
+            z=self.radius / 2,
+        )
+
+    @functools.cached_property
     def transformation(self) -> na.transformations.AbstractTransformation:
         t_center = na.transformations.Cartesian3dTranslation(
-            x=0 * u.mm,
-            y=0 * u.mm,
+            x=_ZERO_MM,
+            y=_ZERO_MM,
             z=-self.radius,
         )
         t_yaw = na.transformations.Cartesian3dRotationY(
             angle=-self.rowland_azimuth,
         )
-        t_img = na.transformations.Cartesian3dTranslation(
-            x=0 * u.mm,
-            y=0 * u.mm,
-            z=self.radius / 2,
-        )
+        t_img = self._translation_image
         return t_img @ super().transformation @ t_yaw @ t_center
 
     @property
@@ -186,16 +199,16 @@ class FeedOptic(
         Coordinate transformation from the global coordinate system
         and the virtual image of the Sun inside the feed optic.
         """
+        return self._translation_image @ self.transformation
 
-        t_img = na.transformations.Cartesian3dTranslation(
-            x=0 * u.mm,
-            y=0 * u.mm,
-            z=self.radius / 2,
-        )
-        return t_img @ self.transformation
-
-    @property
+    @functools.cached_property
     def surface(self) -> optika.surfaces.Surface:
+        aperture_subtent = self.aperture_subtent
+        if isinstance(aperture_subtent, u.Quantity) and aperture_subtent.isscalar:
+            sin_subtent = math.sin(aperture_subtent.to_value(u.rad) / 2)
+        else:
+            sin_subtent = np.sin(aperture_subtent / 2)
+
         return optika.surfaces.Surface(
             name=self.name,
             sag=optika.sags.CylindricalSag(
@@ -204,7 +217,7 @@ class FeedOptic(
             material=self.material,
             aperture=optika.apertures.RectangularAperture(
                 half_width=na.Cartesian2dVectorArray(
-                    x=self.radius * np.sin(self.aperture_subtent / 2),
+                    x=self.radius * sin_subtent,
                     y=self.aperture_height / 2,
                 )
             ),
@@ -1,5 +1,9 @@
+import copy
+import dataclasses
 import pytest
+import numpy as np
 import astropy.units as u
+import optika
 import named_arrays as na
 from optika._tests import test_mixins
 import furst_optics._components_test
@@ -14,7 +18,19 @@ import furst_optics._components_test
             aperture_height=10 * u.mm,
             rowland_radius=1000 * u.mm,
             rowland_azimuth=10 * u.deg,
-        )
+        ),
+        furst_optics.feed_optics.FeedOptic(
+            radius=3 * u.mm,
+            aperture_subtent=10 * u.deg,
+            aperture_height=10 * u.mm,
+            rowland_radius=1000 * u.mm,
+            rowland_azimuth=na.linspace(
+                start=5 * u.deg,
+                stop=45 * u.deg,
+                axis="az",
+                num=7,
+            ),
+        ),
     ],
 )
 class TestFeedOptics(
@@ -28,3 +44,54 @@ class TestFeedOptics(
     def test_transformation_image(self, a: furst_optics.feed_optics.FeedOptic):
         result = a.transformation_image
         assert isinstance(result, na.transformations.AbstractTransformation)
+
+    def test_clear_cache_radius(self, a: furst_optics.feed_optics.FeedOptic):
+        a = copy.copy(a)
+        result = a.transformation_image
+        assert isinstance(result, na.transformations.AbstractTransformation)
+        assert isinstance(a.surface, optika.surfaces.Surface)
+        assert {"surface", "transformation"} <= vars(a).keys()
+        a.radius = 2 * a.radius
+        del a.surface
+        del a.transformation
+        b = dataclasses.replace(a)
+        p = na.Cartesian3dVectorArray(1, 2, 3) * u.mm
+        assert np.all(a.transformation_image(p) == b.transformation_image(p))
+        assert np.all(a.surface.sag(p) == b.surface.sag(p))
+
+
+def test_from_arrays():
+    result = furst_optics.feed_optics.FeedOptic.from_arrays(
+        axis="az",
+        radius=3 * u.mm,
+        aperture_subtent=10 * u.deg,
+        aperture_height=10 * u.mm,
+        rowland_radius=1000 * u.mm,
+        rowland_azimuth=[5, 10, 15] * u.deg,
+    )
+    assert isinstance(result, furst_optics.feed_optics.FeedOptic)
+    assert isinstance(result.surface, optika.surfaces.Surface)
+    assert result.transformation.shape == dict(az=3)
+
+    with pytest.raises(ValueError):
+        furst_optics.feed_optics.FeedOptic.from_arrays(
+            axis="az",
+            rowland_azimuth=na.linspace(0, 10, axis="x", num=3) * u.deg,
+        )
+
+    with pytest.raises(ValueError):
+        furst_optics.feed_optics.FeedOptic.from_arrays(
+            axis="az",
+            rowland_azimuth=[[5, 10], [15, 20]] * u.deg,
+        )
+
+
+def test_from_arrays_ndarray():
+    result = furst_optics.feed_optics.FeedOptic.from_arrays(
+        axis="az",
+        radius=np.array([1.0, 2.0]) * u.mm,
+        rowland_radius=1000 * u.mm,
+        rowland_azimuth=[5 * u.deg, 10 * u.deg],
+    )
+    assert result.radius.shape == dict(az=2)
+    assert result.rowland_azimuth.shape == dict(az=2)
@@ -1,4 +1,6 @@
+import copy
 import pathlib
+import functools
 import numpy as np
 import scipy.optimize
 import astropy.units as u
@@ -11,7 +13,40 @@ __all__ = [
     "coating_witness_fit",
 ]
 
+# Plotting styles of each layer of the coating.
+# These are shared by every call to coating_design(),
+# so they must not be modified in place.
+_KWARGS_PLOT_MGF2 = dict(color="tab:blue", alpha=0.3)
+_KWARGS_PLOT_AL = dict(color="tab:blue", alpha=0.5)
+_KWARGS_PLOT_SUBSTRATE = dict(color="gray", alpha=0.5)
 
+
+def _rays_grid(
+    wavelength: u.Quantity | na.AbstractScalar,
+    angle: u.Quantity | na.AbstractScalar,
+) -> optika.rays.RayVectorArray:
+    """
+    Construct the rays incident on a coating for every combination of the
+    given wavelengths and angles of incidence.
+
+    Parameters
+    ----------
+    wavelength
+        The wavelengths of the incident light.
+    angle
+        The angles of incidence with respect to the normal of the coating.
+    """
+    return optika.rays.RayVectorArray(
+        wavelength=wavelength,
+        direction=na.Cartesian3dVectorArray(
+            x=np.sin(angle),
+            y=0,
+            z=np.cos(angle),
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def coating_design() -> optika.materials.MultilayerMirror:
     """
     The as-designed coating for the FURST feed optics, Acton Optics
@@ -20,6 +55,9 @@ def coating_design() -> optika.materials.MultilayerMirror:
     Since we presumably don't know the formula of this proprietary
     coating, this function uses the formula in :cite:t:`Quijada2012`.
 
+    The result is cached, so every call returns the same object.
+    Use :func:`copy.deepcopy` on the result before modifying it.
+
     Examples
     --------
 
@@ -76,33 +114,41 @@ def coating_design() -> optika.materials.MultilayerMirror:
                 chemical="MgF2",
                 thickness=25 * u.nm,
                 interface=optika.materials.profiles.ErfInterfaceProfile(1 * u.nm),
-                kwargs_plot=dict(
-                    color="tab:blue",
-                    alpha=0.3,
-                ),
+                kwargs_plot=_KWARGS_PLOT_MGF2,
             ),
             optika.materials.Layer(
                 chemical="Al",
                 thickness=60 * u.nm,
                 interface=optika.materials.profiles.ErfInterfaceProfile(1 * u.nm),
-                kwargs_plot=dict(
-                    color="tab:blue",
-                    alpha=0.5,
-                ),
+                kwargs_plot=_KWARGS_PLOT_AL,
             ),
         ],
         substrate=optika.materials.Layer(
             chemical="SiO2",
             thickness=3 * u.mm,
             interface=optika.materials.profiles.ErfInterfaceProfile(1 * u.nm),
-            kwargs_plot=dict(
-                color="gray",
-                alpha=0.5,
-            ),
+            kwargs_plot=_KWARGS_PLOT_SUBSTRATE,
         ),
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _load_witness_raw() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Load the wavelength (in nm) and reflectivity (in percent) of the
+    witness sample measurement.
+
+    The result is cached, so callers must copy these arrays
+    before modifying them.
+    """
+    wavelength, reflectivity = np.loadtxt(
+        fname=pathlib.Path(__file__).parent / "_data/witness-2023-May-24.txt",
+        skiprows=1,
+        unpack=True,
+    )
+    return wavelength, reflectivity
+
+
 def coating_witness_measured() -> optika.materials.MeasuredMirror:
     """
     A reflectivity measurement of the witness samples to the
@@ -172,13 +218,12 @@ def coating_witness_measured() -> optika.materials.MeasuredMirror:
             ax.set_ylabel("reflectivity");
             ax.legend();
     """
-    wavelength, reflectivity = np.loadtxt(
-        fname=pathlib.Path(__file__).parent / "_data/witness-2023-May-24.txt",
-        skiprows=1,
-        unpack=True,
+    wavelength, reflectivity = _load_witness_raw()
+    wavelength = na.ScalarArray(wavelength.copy() << u.nm, axes="wavelength")
+    reflectivity = na.ScalarArray(
+        (0.01 * reflectivity) << u.dimensionless_unscaled,
+        axes="wavelength",
     )
-    wavelength = na.ScalarArray(wavelength << u.nm, axes="wavelength")
-    reflectivity = na.ScalarArray(reflectivity << u.percent, axes="wavelength")
 
     result = optika.materials.MeasuredMirror(
         efficiency_measured=na.FunctionArray(
@@ -186,7 +231,7 @@ def coating_witness_measured() -> optika.materials.MeasuredMirror:
                 wavelength=wavelength,
                 direction=75 * u.deg,
             ),
-            outputs=reflectivity.to(u.dimensionless_unscaled),
+            outputs=reflectivity,
         ),
         substrate=optika.materials.Layer(
             chemical="SiO2",
@@ -262,38 +307,36 @@ def coating_witness_fit() -> optika.materials.MultilayerMirror:
         coating
     """
 
-    design = coating_design()
+    multilayer = copy.deepcopy(coating_design())
 
     measurement = coating_witness_measured()
     unit = u.nm
 
-    reflectivity = measurement.efficiency_measured.outputs
+    reflectivity = measurement.efficiency_measured.outputs.ndarray
+    reflectivity = reflectivity.to_value(u.dimensionless_unscaled)
     angle_incidence = measurement.efficiency_measured.inputs.direction
+    wavelength = measurement.efficiency_measured.inputs.wavelength.to(unit)
 
-    rays = optika.rays.RayVectorArray(
-        wavelength=measurement.efficiency_measured.inputs.wavelength,
-        direction=na.Cartesian3dVectorArray(
-            x=np.sin(angle_incidence),
-            y=0,
-            z=np.cos(angle_incidence),
-        ),
+    rays = _rays_grid(
+        wavelength=wavelength,
+        angle=angle_incidence,
     )
-
     normal = na.Cartesian3dVectorArray(0, 0, -1)
 
+    difference = np.empty_like(reflectivity)
+
     def _coating(
         thickness_MgF2: float,
         thickness_Al: float,
         width_interface: float,
     ):
-        result = coating_design()
-        result.layers[0].thickness = thickness_MgF2 * unit
-        result.layers[1].thickness = thickness_Al * unit
-        result.layers[0].interface.width = width_interface * unit
-        result.layers[1].interface.width = width_interface * unit
-        result.substrate.interface.width = width_interface * unit
+        multilayer.layers[0].thickness = thickness_MgF2 * unit
+        multilayer.layers[1].thickness = thickness_Al * unit
+        multilayer.layers[0].interface.width = width_interface * unit
+        multilayer.layers[1].interface.width = width_interface * unit
+        multilayer.substrate.interface.width = width_interface * unit
 
-        return result
+        return multilayer
 
     def _func(x: np.ndarray):
 
@@ -304,22 +347,37 @@ def coating_witness_fit() -> optika.materials.MultilayerMirror:
             normal=normal,
         )
 
-        result = np.sqrt(np.mean(np.square(reflectivity_fit - reflectivity)))
+        np.subtract(
+            reflectivity_fit.ndarray.to_value(u.dimensionless_unscaled),
+            reflectivity,
+            out=difference,
+        )
+
+        result = np.sqrt(np.einsum("i,i->", difference, difference) / difference.size)
 
-        return result.ndarray.value
+        return result
 
     fit = scipy.optimize.minimize(
         fun=_func,
         x0=[
-            design.layers[0].thickness.to_value(unit),
-            design.layers[1].thickness.to_value(unit),
-            design.substrate.interface.width.to_value(unit),
+            multilayer.layers[0].thickness.to_value(unit),
+            multilayer.layers[1].thickness.to_value(unit),
+            multilayer.substrate.interface.width.to_value(unit),
         ],
         bounds=[
             (0, None),
             (0, None),
             (0, None),
         ],
+        method="L-BFGS-B",
+        # The reflectivity varies smoothly over ~1 nm, so use a
+        # finite-difference step of 0.01 nm instead of the default ~1e-8 nm.
+        options=dict(
+            eps=0.01,
+            ftol=1e-6,
+            gtol=1e-5,
+            maxiter=100,
+        ),
     )
 
     return _coating(*fit.x)
@@ -1,3 +1,5 @@
+import astropy.units as u
+import named_arrays as na
 import optika
 import furst_optics
 
@@ -5,6 +7,7 @@ import furst_optics
 def test_coating_design():
     r = furst_optics.feed_optics.materials.coating_design()
     assert isinstance(r, optika.materials.AbstractMultilayerMirror)
+    assert furst_optics.feed_optics.materials.coating_design() is r
 
 
 def test_coating_witness_measured():
@@ -12,6 +15,25 @@ def test_coating_witness_measured():
     assert isinstance(r, optika.materials.MeasuredMirror)
 
 
+def test_coating_witness_measured_copy():
+    a = furst_optics.feed_optics.materials.coating_witness_measured()
+    a.efficiency_measured.inputs.wavelength.ndarray[0] = 0 * u.nm
+    b = furst_optics.feed_optics.materials.coating_witness_measured()
+    assert b.efficiency_measured.inputs.wavelength.ndarray[0] != 0 * u.nm
+
+
 def test_coating_witness_fit():
     r = furst_optics.feed_optics.materials.coating_witness_fit()
     assert isinstance(r, optika.materials.MultilayerMirror)
+    assert r is not furst_optics.feed_optics.materials.coating_design()
+
+
+def test__rays_grid():
+    wavelength = na.linspace(120, 180, axis="wavelength", num=5) * u.nm
+    angle = na.linspace(0, 75, axis="angle", num=3) * u.deg
+    r = furst_optics.feed_optics.materials._materials._rays_grid(
+        wavelength=wavelength,
+        angle=angle,
+    )
+    assert isinstance(r, optika.rays.RayVectorArray)
+    assert r.shape == dict(wavelength=5, angle=3)
@@ -1,4 +1,5 @@
 from typing import Generic
+import functools
 import dataclasses
 import astropy.units as u
 import named_arrays as na
@@ -9,6 +10,9 @@ __all__ = [
     "Grating",
 ]
 
+_ZERO_MM = 0 * u.mm
+_ZERO_DEG = 0 * u.deg
+
 
 @dataclasses.dataclass(eq=False, repr=False)
 class Grating(
@@ -96,17 +100,17 @@ class Grating(
     The sag profile of the grating surface.
     """
 
-    radius: u.Quantity | na.AbstractScalar = 0 * u.mm
+    radius: u.Quantity | na.AbstractScalar = _ZERO_MM
     """
     The radius of curvature of the optical surface.
     """
 
-    width_clear: u.Quantity | na.AbstractCartesian2dVectorArray = 0 * u.mm
+    width_clear: u.Quantity | na.AbstractCartesian2dVectorArray = _ZERO_MM
     """
     The height and width of the clear aperture of the grating.
     """
 
-    width_mech: u.Quantity | na.AbstractCartesian2dVectorArray = 0 * u.mm
+    width_mech: u.Quantity | na.AbstractCartesian2dVectorArray = _ZERO_MM
     """
     The height and width of the grating substrate.
     """
@@ -122,44 +126,48 @@ class Grating(
     A model of the grating ruling spacing and profile.
     """
 
-    rowland_radius: u.Quantity | na.AbstractScalar = 0 * u.mm
+    rowland_radius: u.Quantity | na.AbstractScalar = _ZERO_MM
     """
     The distance from the center of the Rowland circle to
     the virtual image of the Sun within the feed optic.
     """
 
-    rowland_azimuth: u.Quantity | na.AbstractScalar = 0 * u.deg
+    rowland_azimuth: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The azimuth of the virtual image of the Sun
     on the Rowland circle, relative to the optic axis
     of the instrument.
     """
 
-    translation: u.Quantity | na.AbstractCartesian3dVectorArray = 0 * u.mm
+    translation: u.Quantity | na.AbstractCartesian3dVectorArray = _ZERO_MM
     """
     Physical offset from the optic's nominal position on the
     Rowland circle.
     """
 
-    pitch: u.Quantity | na.AbstractScalar = 0 * u.deg
+    pitch: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the vector tangent to the
     Rowland circle.
     """
 
-    yaw: u.Quantity | na.AbstractScalar = 0 * u.deg
+    yaw: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the axis of symmetry
     of the feed optic.
     """
 
-    roll: u.Quantity | na.AbstractScalar = 0 * u.deg
+    roll: u.Quantity | na.AbstractScalar = _ZERO_DEG
     """
     The angle of rotation about the vector normal to
     the Rowland circle.
     """
 
-    @property
+    @functools.cached_property
+    def transformation(self) -> na.transformations.AbstractTransformation:
+        return super().transformation
+
+    @functools.cached_property
     def surface(self) -> optika.surfaces.Surface:
         return optika.surfaces.Surface(
             name=self.name,
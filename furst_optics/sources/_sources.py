@@ -1,3 +1,4 @@
+import functools
 import dataclasses
 import numpy as np
 import astropy.units as u
@@ -11,6 +12,9 @@ __all__ = [
     "SolarDisk",
 ]
 
+_ZERO_MM = 0 * u.mm
+_DEFAULT_RADIUS = sunpy.sun.constants.average_angular_size
+
 
 @dataclasses.dataclass(eq=False, repr=False)
 class AbstractSource(
@@ -38,14 +42,14 @@ class SolarDisk(
     :obj:`sunpy.sun.constants.average_angular_size` is used.
     """
 
-    translation: u.Quantity | na.AbstractCartesian3dVectorArray = 0 * u.mm
+    translation: u.Quantity | na.AbstractCartesian3dVectorArray = _ZERO_MM
     """Offset of the solar disk on the celestial sphere."""
 
     def __post_init__(self):
         if self.radius is None:
-            self.radius = sunpy.sun.constants.average_angular_size
+            self.radius = _DEFAULT_RADIUS
 
-    @property
+    @functools.cached_property
     def surface(self) -> optika.surfaces.Surface:
         return optika.surfaces.Surface(
             name="solar disk",
@@ -1,3 +1,5 @@
+import copy
+import dataclasses
 import pytest
 import astropy.units as u
 import optika._tests.test_mixins
@@ -20,3 +22,12 @@ class TestSolarDisk(
         assert isinstance(result, optika.surfaces.Surface)
         assert isinstance(result.aperture, optika.apertures.CircularAperture)
         assert result.aperture.radius > 0
+
+    def test_clear_cache_radius(self, a: furst_optics.sources.SolarDisk):
+        a = copy.copy(a)
+        assert isinstance(a.surface, optika.surfaces.Surface)
+        assert "surface" in vars(a)
+        a.radius = 2 * a.radius
+        del a.surface
+        b = dataclasses.replace(a)
+        assert a.surface.aperture.radius == b.surface.aperture.radius
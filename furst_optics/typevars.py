@@ -5,11 +5,13 @@ in this project.
 
 from typing import TypeVar
 import optika
+import furst_optics
 
 __all__ = [
     "SagT",
     "MaterialT",
     "RulingT",
+    "ComponentT",
 ]
 
 
@@ -27,3 +29,8 @@ MaterialT = TypeVar("MaterialT", bound=None | optika.materials.AbstractMaterial)
 #: Should be :obj:`None` or a subclass of
 #: :class:`optika.rulings.AbstractRulings`
 RulingT = TypeVar("RulingT", bound=None | optika.rulings.AbstractRulings)
+
+#: Component type variable.
+#: Should be a subclass of
+#: :class:`furst_optics.abc.AbstractComponent`
+ComponentT = TypeVar("ComponentT", bound="furst_optics.abc.AbstractComponent")